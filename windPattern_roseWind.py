@@ -5,16 +5,211 @@ import matplotlib.pyplot as plt
 from matplotlib.projections import PolarAxes
 import mpl_toolkits.axisartist.grid_finder as gf
 import mpl_toolkits.axisartist.floating_axes as fa
+from scipy.special import gamma
 from scipy.stats import weibull_min
+from concurrent.futures import ProcessPoolExecutor
+from types import SimpleNamespace
 from typing import Dict, List, Optional, Tuple
 import os
 
+# Número de elementos processados por bloco nos kernels de redução
+_TAMANHO_BLOCO = 8192
+
+# Tabela de cores viridis (256 x RGBA), avaliada uma única vez
+_VIRIDIS_LUT = plt.cm.viridis(np.arange(plt.cm.viridis.N)).astype(np.float32)
+
+# Número de setores direcionais padrão (índices pré-calculados no pré-processamento)
+_SETORES_PADRAO = 16
+
+# Limite de iterações do ajuste de Weibull por setor
+_MAX_ITERACOES_WEIBULL = 100
+
+def _media_circular(direcoes: np.ndarray) -> float:
+    """
+    Calcula a média circular de direções em graus percorrendo o vetor em blocos.
+
+    Os temporários (radianos, seno e cosseno) têm o tamanho de um bloco e
+    permanecem em cache, em vez de ocupar arrays do tamanho da série completa.
+    Entradas em float32 são promovidas a float64 bloco a bloco.
+
+    Args:
+        direcoes (np.ndarray): Direções em graus
+
+    Returns:
+        float: Direção média em graus (0-360), NaN se não houver dados
+    """
+    if direcoes.shape[0] == 0:
+        return np.nan
+    radianos = np.empty(min(direcoes.shape[0], _TAMANHO_BLOCO))
+    trig = np.empty_like(radianos)
+    soma_sen = 0.0
+    soma_cos = 0.0
+    for inicio in range(0, direcoes.shape[0], _TAMANHO_BLOCO):
+        bloco = direcoes[inicio:inicio + _TAMANHO_BLOCO]
+        rad = np.deg2rad(bloco, out=radianos[:bloco.shape[0]])
+        soma_sen += np.sin(rad, out=trig[:bloco.shape[0]]).sum()
+        soma_cos += np.cos(rad, out=trig[:bloco.shape[0]]).sum()
+    return (np.rad2deg(np.arctan2(soma_sen, soma_cos)) + 360) % 360
+
+def _estatisticas_basicas(velocidades: np.ndarray,
+                          limite_calmaria: float = 0.5) -> Tuple[float, float, float, float, float]:
+    """
+    Calcula média, máximo, mínimo, desvio padrão e fração de calmaria em uma
+    única passada pelo vetor, processado em blocos.
+
+    Cada bloco é lido uma vez da memória e reduzido enquanto está em cache; as
+    médias e somas de quadrados dos blocos são combinadas pelo método de
+    Welford/Chan, em float64.
+
+    Args:
+        velocidades (np.ndarray): Velocidades do vento em m/s
+        limite_calmaria (float): Velocidade abaixo da qual o registro é calmaria
+
+    Returns:
+        Tuple[float, float, float, float, float]: Média, máximo, mínimo, desvio
+            padrão amostral e fração de calmaria (NaN se não houver dados)
+    """
+    if velocidades.shape[0] == 0:
+        return np.nan, np.nan, np.nan, np.nan, np.nan
+    buffer = np.empty(min(velocidades.shape[0], _TAMANHO_BLOCO))
+    n = 0
+    media = 0.0
+    m2 = 0.0
+    maximo = -np.inf
+    minimo = np.inf
+    calmarias = 0
+    for inicio in range(0, velocidades.shape[0], _TAMANHO_BLOCO):
+        bloco = buffer[:min(_TAMANHO_BLOCO, velocidades.shape[0] - inicio)]
+        bloco[:] = velocidades[inicio:inicio + bloco.shape[0]]
+        m = bloco.shape[0]
+        maximo = max(maximo, bloco.max())
+        minimo = min(minimo, bloco.min())
+        calmarias += np.count_nonzero(bloco < limite_calmaria)
+
+        media_bloco = bloco.sum() / m
+        bloco -= media_bloco
+        m2_bloco = np.dot(bloco, bloco)
+
+        # Combinar com o acumulado (Welford/Chan)
+        delta = media_bloco - media
+        total = n + m
+        media += delta * m / total
+        m2 += m2_bloco + delta * delta * n * m / total
+        n = total
+    desvio = np.sqrt(m2 / (n - 1)) if n > 1 else np.nan
+    return media, maximo, minimo, desvio, calmarias / n
+
+def _indices_setor(direcoes: np.ndarray, setores: int) -> np.ndarray:
+    """
+    Calcula o índice do setor direcional de cada direção sem comparações por setor.
+
+    O índice é obtido por multiplicação e truncamento (floor(direcao * setores / 360)),
+    em float64 para que direções sobre os limites caiam no mesmo setor que
+    np.digitize; o último setor inclui o limite de 360°.
+
+    Args:
+        direcoes (np.ndarray): Direções em graus (0-360)
+        setores (int): Número de setores direcionais
+
+    Returns:
+        np.ndarray: Índices dos setores (0 a setores-1) no menor tipo inteiro sem sinal
+    """
+    escalado = np.multiply(direcoes, setores, dtype=np.float64)
+    escalado /= 360
+    np.minimum(escalado, setores - 1, out=escalado)
+    return escalado.astype(np.min_scalar_type(setores - 1))
+
+def _ajustar_weibull_setores(velocidades: np.ndarray, id_setor: np.ndarray,
+                             setores: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Ajusta Weibulls de 2 parâmetros (loc=0) por máxima verossimilhança para
+    todos os setores direcionais simultaneamente.
+
+    Com loc fixo em zero, a MLE se reduz a uma equação monótona no parâmetro
+    de forma k de cada setor. As equações são resolvidas em conjunto por Newton
+    com salvaguarda de bissecção, usando somas por setor (np.bincount) sobre o
+    vetor completo; a escala c sai em forma fechada. Velocidades nulas não
+    entram no ajuste (log(0) é indefinido).
+
+    Args:
+        velocidades (np.ndarray): Velocidades do vento em m/s
+        id_setor (np.ndarray): Índice do setor (0 a setores-1) de cada velocidade
+        setores (int): Número de setores direcionais
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Parâmetros de forma (k) e escala (c) por
+            setor (NaN para setores sem dados suficientes)
+    """
+    positivos = velocidades > 0
+    x = velocidades[positivos].astype(np.float64)
+    ids = id_setor[positivos]
+    n = np.bincount(ids, minlength=setores)
+
+    # Normalizar pelo máximo do setor evita overflow em x**k (a equação em k é invariante à escala)
+    escala = np.zeros(setores)
+    np.maximum.at(escala, ids, x)
+    np.divide(x, escala[ids], out=x)
+    log_x = np.log(x, out=x)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        media_log = np.bincount(ids, weights=log_x, minlength=setores) / n
+        var_log = np.bincount(ids, weights=log_x * log_x, minlength=setores) / n - media_log**2
+        # Estimador de Menon como ponto de partida
+        k = 1.2825 / np.sqrt(var_log)
+        validos = (n >= 2) & np.isfinite(k)
+        k[~validos] = 1.0
+
+        # Intervalo [inf, sup] que contém a raiz de cada setor
+        inf = np.zeros(setores)
+        sup = np.full(setores, np.inf)
+        # Buffers reaproveitados a cada iteração (evita alocar temporários do tamanho da amostra)
+        x_k = np.empty_like(log_x)
+        aux = np.empty_like(log_x)
+        for _ in range(_MAX_ITERACOES_WEIBULL):
+            # x**k = exp(k*log(x)), com log(x) calculado uma única vez
+            np.take(k, ids, out=x_k)
+            np.multiply(x_k, log_x, out=x_k)
+            np.exp(x_k, out=x_k)
+            s0 = np.bincount(ids, weights=x_k, minlength=setores)
+            np.multiply(x_k, log_x, out=aux)
+            s1 = np.bincount(ids, weights=aux, minlength=setores)
+            np.multiply(aux, log_x, out=aux)
+            s2 = np.bincount(ids, weights=aux, minlength=setores)
+            m1 = s1 / s0
+            g = 1 / k + media_log - m1
+            dg = -1 / k**2 - (s2 / s0 - m1**2)
+
+            # g é decrescente em k: g > 0 indica raiz à direita
+            inf = np.where(g > 0, k, inf)
+            sup = np.where(g > 0, sup, k)
+            k_novo = k - g / dg
+            fora = ~((k_novo > inf) & (k_novo < sup))
+            k_novo[fora] = np.where(np.isinf(sup), 2 * k, (inf + sup) / 2)[fora]
+            k_novo[~validos] = 1.0
+
+            convergiu = np.abs(k_novo - k) <= 1e-10 * k
+            k = k_novo
+            if convergiu.all():
+                break
+
+        np.take(k, ids, out=x_k)
+        np.multiply(x_k, log_x, out=x_k)
+        np.exp(x_k, out=x_k)
+        c = escala * (np.bincount(ids, weights=x_k, minlength=setores) / n) ** (1 / k)
+
+    k[~validos] = np.nan
+    c[~validos] = np.nan
+    return k, c
+
 class WindAnalyzer:
     """
     Classe para análise avançada de padrões de vento e geração de rosas dos ventos.
     
     Atributos:
-        dados (pd.DataFrame): DataFrame contendo os dados de vento
+        dados (pd.DataFrame): DataFrame contendo os dados de vento (não deve ser
+            modificado após a inicialização, pois as posições das linhas de cada estação
+            são pré-calculadas e os dados da estação são recortados sob demanda;
+            colunas não convertidas compartilham memória com o DataFrame de entrada)
         estacoes (List[str]): Lista de estações disponíveis nos dados
         parametros_weibull (Dict): Dicionário com parâmetros de Weibull calculados
     """
@@ -29,23 +224,137 @@ class WindAnalyzer:
                 - 'direcao': direção do vento em graus (0-360)
                 - 'velocidade': velocidade do vento em m/s
         """
-        self.dados = dados.copy()
+        # Cópia rasa: o pré-processamento gera novos DataFrames em vez de modificar
+        # os dados, então a entrada nunca é alterada; as colunas que não precisam de
+        # conversão (ex.: 'estacao', 'data') continuam compartilhando memória com ela
+        self.dados = dados.copy(deep=False)
         self.estacoes = self.dados['estacao'].unique().tolist()
         self.parametros_weibull = {}
+        self._cache_setores: Dict[int, SimpleNamespace] = {}
+        self._cache_colunas: Dict[Tuple[Optional[str], str], np.ndarray] = {}
 
         # Pré-processamento
         self._preprocess_data()
     
     def _preprocess_data(self) -> None:
         """Realiza pré-processamento dos dados (limpeza, normalização)."""
+        # Cada etapa só gera um novo DataFrame se os dados realmente precisarem
+        # de correção (caso comum em dados já controlados em qualidade); com a
+        # conversão final sem cópia, dados limpos mantêm as colunas não convertidas
+        # compartilhadas com a entrada
+        dados = self.dados
+
         # Remover valores nulos
-        self.dados.dropna(subset=['direcao', 'velocidade'], inplace=True)
+        if dados['direcao'].isna().any() or dados['velocidade'].isna().any():
+            dados = dados.dropna(subset=['direcao', 'velocidade'])
 
         # Garantir que a direção está entre 0-360
-        self.dados['direcao'] = self.dados['direcao'] % 360
+        if not dados['direcao'].between(0, 360, inclusive='left').all():
+            dados = dados.assign(direcao=dados['direcao'] % 360)
 
         # Garantir que a velocidade seja maior ou igual a zero
-        self.dados = self.dados[self.dados['velocidade'] >= 0]
+        if (dados['velocidade'] < 0).any():
+            dados = dados[dados['velocidade'] >= 0]
+
+        self.dados = dados
+
+        # Precisão simples é suficiente para os instrumentos (~0.1 m/s, 1°) e reduz
+        # pela metade o volume lido em cada varredura; as reduções acumulam em float64
+        # (copy=False: as demais colunas não são duplicadas)
+        self.dados = self.dados.astype({'direcao': np.float32, 'velocidade': np.float32}, copy=False)
+
+        # Índice do setor direcional padrão, calculado uma única vez
+        self.dados[f'setor{_SETORES_PADRAO}'] = _indices_setor(self.dados['direcao'].to_numpy(), _SETORES_PADRAO)
+
+        # Posições das linhas de cada estação, calculadas uma única vez (sem copiar os dados)
+        self._indices_estacao = self.dados.groupby('estacao', sort=False).indices
+
+    def _posicoes_estacao(self, estacao: Optional[str]) -> Optional[np.ndarray]:
+        """
+        Retorna as posições das linhas de uma estação.
+
+        Args:
+            estacao (str): Nome da estação (None para todas)
+
+        Returns:
+            np.ndarray: Posições das linhas da estação (vazio se a estação não tiver
+                registros válidos), ou None se a seleção abranger todos os dados
+        """
+        if estacao is None:
+            return None
+        posicoes = self._indices_estacao.get(estacao, np.empty(0, dtype=np.intp))
+        return None if len(posicoes) == len(self.dados) else posicoes
+
+    def _dados_estacao(self, estacao: Optional[str]) -> pd.DataFrame:
+        """
+        Retorna os dados de uma estação, recortados sob demanda a partir das posições pré-calculadas.
+
+        Args:
+            estacao (str): Nome da estação (None para todas)
+
+        Returns:
+            pd.DataFrame: Dados da estação (vazio se a estação não tiver registros válidos)
+        """
+        posicoes = self._posicoes_estacao(estacao)
+        return self.dados if posicoes is None else self.dados.iloc[posicoes]
+
+    def _layout_setores(self, setores: int) -> SimpleNamespace:
+        """
+        Retorna a geometria dos setores direcionais, calculada uma vez por número de setores.
+
+        Args:
+            setores (int): Número de setores direcionais
+
+        Returns:
+            SimpleNamespace: Centros dos setores em radianos (theta) e largura
+                dos setores em graus e em radianos
+        """
+        if setores not in self._cache_setores:
+            largura = 360 / setores
+            self._cache_setores[setores] = SimpleNamespace(
+                theta=np.deg2rad((np.arange(setores) + 0.5) * largura),
+                largura=largura,
+                largura_rad=np.deg2rad(largura),
+            )
+        return self._cache_setores[setores]
+
+    def _coluna(self, nome: str, estacao: Optional[str] = None) -> np.ndarray:
+        """
+        Retorna uma coluna dos dados como array NumPy contíguo, convertido uma única vez.
+
+        Args:
+            nome (str): Nome da coluna
+            estacao (str): Nome da estação (None para todas)
+
+        Returns:
+            np.ndarray: Valores da coluna (somente leitura)
+        """
+        chave = (estacao, nome)
+        if chave not in self._cache_colunas:
+            valores = self.dados[nome].to_numpy()
+            posicoes = self._posicoes_estacao(estacao)
+            if posicoes is not None:
+                valores = valores[posicoes]
+            valores = np.ascontiguousarray(valores)
+            # Pode ser uma visão de self.dados: impedir escrita que corromperia os dados
+            valores.flags.writeable = False
+            self._cache_colunas[chave] = valores
+        return self._cache_colunas[chave]
+
+    def _ids_setor(self, estacao: Optional[str], setores: int) -> np.ndarray:
+        """
+        Retorna o índice do setor direcional de cada registro.
+
+        Args:
+            estacao (str): Nome da estação (None para todas)
+            setores (int): Número de setores direcionais
+
+        Returns:
+            np.ndarray: Índices dos setores (pré-calculados para o número padrão de setores)
+        """
+        if setores == _SETORES_PADRAO:
+            return self._coluna(f'setor{_SETORES_PADRAO}', estacao)
+        return _indices_setor(self._coluna('direcao', estacao), setores)
     
     def calcular_estatisticas(self, estacao: str = None) -> Dict:
         """
@@ -57,37 +366,34 @@ class WindAnalyzer:
         Returns:
             Dict: Dicionário com estatísticas calculadas
         """
-        dados = self.dados if estacao is None else self.dados[self.dados['estacao'] == estacao]
+        # Estatísticas da velocidade em uma única passada (desvio amostral, como no pandas)
+        media, maximo, minimo, desvio, calmaria = _estatisticas_basicas(self._coluna('velocidade', estacao))
 
         estatisticas = {
-            'media_velocidade': dados['velocidade'].mean(),
-            'max_velocidade': dados['velocidade'].max(),
-            'min_velocidade': dados['velocidade'].min(),
-            'desvio_velocidade': dados['velocidade'].std(),
-            'media_direcao': self._calcular_direcao_media(dados['direcao']),
-            'frequencia_calmar': (dados['velocidade'] < 0.5).mean(),
-            'turbulencia': dados['velocidade'].std() /  dados['velocidade'].mean()
+            'media_velocidade': media,
+            'max_velocidade': maximo,
+            'min_velocidade': minimo,
+            'desvio_velocidade': desvio,
+            'media_direcao': self._calcular_direcao_media(self._coluna('direcao', estacao)),
+            'frequencia_calmar': calmaria,
+            'turbulencia': desvio / media
         }
 
         return estatisticas
     
-    def _calcular_direcao_media(self, direcoes: pd.Series) -> float:
+    def _calcular_direcao_media(self, direcoes: np.ndarray) -> float:
         """
         Calcula a direção média considerando a circularidade dos dados.
         
         Args:
-            direcoes (pd.Series): Série com direções em graus
+            direcoes (np.ndarray): Direções em graus
             
         Returns:
             float: Direção média em graus (0-360)
         """
-        radianos = np.deg2rad(direcoes)
-        media_sen = np.sin(radianos).mean()
-        media_cos = np.cos(radianos).mean()
-        media_rad = np.arctan2(media_sen, media_cos)
-        return (np.rad2deg(media_rad) + 360) % 360
+        return _media_circular(direcoes)
     
-    def ajustar_distribuicao_weibull(self, estacao: str = None, setores: int = 16) -> Dict:
+    def ajustar_distribuicao_weibull(self, estacao: str = None, setores: int = _SETORES_PADRAO) -> Dict:
         """
         Ajusta distribuição de Weibull para os dados de velocidade do vento.
         
@@ -96,30 +402,23 @@ class WindAnalyzer:
             setores (int): Número de setores direcionais (default: 16)
             
         Returns:
-            Dict: Parâmetros de Weibull (k, c) por setor direcional
+            Dict: Arrays paralelos com o índice do setor ('setor'), os parâmetros de
+                Weibull ('k', 'c') e a frequência ('frequencia') dos setores ajustados
         """
-        dados = self.dados if estacao is None else self.dados[self.dados['estacao'] == estacao]
-        
-        # Calcular limites dos setores
-        limites_setores = np.linspace(0, 360, setores + 1)
-        
-        parametros = {}
-        for i in range(setores):
-            limite_inf = limites_setores[i]
-            limite_sup = limites_setores[i + 1]
-            
-            # Filtrar dados do setor
-            if i == setores - 1:
-                mascara = (dados['direcao'] >= limite_inf) & (dados['direcao'] <= limite_sup)
-            else:
-                mascara = (dados['direcao'] >= limite_inf) & (dados['direcao'] < limite_sup)
-                
-            dados_setor = dados[mascara]['velocidade']
-            
-            # Ajustar Weibull se houver dados suficientes
-            if len(dados_setor) > 10:
-                shape, loc, scale = weibull_min.fit(dados_setor, floc=0)
-                parametros[f'setor_{i}'] = {'k': shape, 'c': scale, 'frequencia': len(dados_setor)/len(dados)}
+        id_setor = self._ids_setor(estacao, setores)
+
+        contagens = np.bincount(id_setor, minlength=setores)
+        k, c = _ajustar_weibull_setores(self._coluna('velocidade', estacao), id_setor, setores)
+
+        # Registrar Weibull dos setores com dados suficientes (setores degenerados,
+        # ex.: só calmarias ou velocidades idênticas, não têm ajuste e ficam de fora)
+        ajustados = np.flatnonzero((contagens > 10) & np.isfinite(k))
+        parametros = {
+            'setor': ajustados,
+            'k': k[ajustados],
+            'c': c[ajustados],
+            'frequencia': contagens[ajustados] / id_setor.size,
+        }
         
         # Armazenar parâmetros para uso posterior
         chave = estacao if estacao else 'global'
@@ -140,19 +439,14 @@ class WindAnalyzer:
         """
         if estacao not in self.parametros_weibull:
             self.ajustar_distribuicao_weibull(estacao)
-        parametros = self.parametros_weibull[estacao]
-        potencia_total = 0.0
-
-        for setor, vals in parametros.items():
-            k, c, freq = vals['k'], vals['c'], vals['frequencia']
-            # Fator de correção para potência média
-            potencia_media = 0.5 * densidade_ar * (c**3) * (1+3/k) * freq
-            potencia_total += potencia_media
-        
-        return potencia_total
+        p = self.parametros_weibull[estacao]
 
-    def plotar_rosa_ventos(self, estacao: str = None, setores: int = 16, 
-                        figsize: Tuple = (10,10), titulo: str = None) -> plt.Figure:
+        # Densidade de potência média da Weibull (E[v³] = c³·Γ(1+3/k)) ponderada pela frequência do setor
+        return 0.5 * densidade_ar * np.sum(p['c']**3 * gamma(1 + 3 / p['k']) * p['frequencia'])
+
+    def plotar_rosa_ventos(self, estacao: str = None, setores: int = _SETORES_PADRAO, 
+                        figsize: Tuple = (10,10), titulo: str = None,
+                        fig: plt.Figure = None) -> plt.Figure:
         """
         Gera uma rosa dos ventos polar para os dados.
         
@@ -161,37 +455,38 @@ class WindAnalyzer:
             setores (int): Número de setores direcionais (default: 16)
             figsize (Tuple): Tamanho da figura (width, height)
             titulo (str): Título do gráfico
+            fig (plt.Figure): Figura a ser limpa e reutilizada, útil ao gerar várias
+                rosas em sequência (None para criar uma nova)
             
         Returns:
             plt.Figure: Figura matplotlib com a rosa dos ventos
         """
-        dados = self.dados if estacao is None else self.dados[self.dados['estacao'] == estacao]
-
-        #Calcular frequencias direcionais
-        limites_setores = np.linspace(0, 360, setores + 1)
-        direcoes_centro = (limites_setores[:-1] + limites_setores[1:]) / 2
-        frequencias, _ =  np.histogram(dados['direcao'], bins=limites_setores, density=True)
-
-        # Calcular velocidades médias por setor
-        velocidades_medias = []
-        for i in range(setores):
-            if i == setores - 1:
-                mascara = (dados['direcao'] >= limites_setores[i]) & (dados['direcao'] <= limites_setores[i+1])
-            else:
-                mascara = (dados['direcao'] >= limites_setores[i]) & (dados['direcao'] < limites_setores[i+1])
-            velocidades_medias.append(dados[mascara]['velocidade'].mean())
+        layout = self._layout_setores(setores)
+
+        #Calcular frequencias direcionais (densidade por grau, como np.histogram(density=True))
+        id_setor = self._ids_setor(estacao, setores)
+        contagens = np.bincount(id_setor, minlength=setores)
+        frequencias = contagens / contagens.sum() / layout.largura
+
+        # Calcular velocidades médias por setor (NaN para setores vazios)
+        somas = np.bincount(id_setor, weights=self._coluna('velocidade', estacao), minlength=setores)
+        velocidades_medias = np.divide(somas, contagens, out=np.full(setores, np.nan), where=contagens > 0)
         
         # Configurar plot polar
-        fig = plt.figure(figsize=figsize)
+        if fig is None:
+            fig = plt.figure(figsize=figsize)
+        else:
+            fig.clear()
         ax = fig.add_subplot(111, projection='polar')
 
-        # Converter oara radianos
-        theta = np.deg2rad(direcoes_centro)
-        width = np.deg2rad(360 / setores)
+        # Cores por velocidade consultando a tabela viridis (setores vazios ficam transparentes)
+        vmin, vmax = np.nanmin(velocidades_medias), np.nanmax(velocidades_medias)
+        escala = np.nan_to_num(velocidades_medias / vmax, nan=0.0) * len(_VIRIDIS_LUT)
+        cores = _VIRIDIS_LUT[np.clip(escala.astype(np.int32), 0, len(_VIRIDIS_LUT) - 1)]
+        cores[np.isnan(velocidades_medias)] = 0
 
         #Plotar barras com cores por velocidade
-        bars = ax.bar(theta, frequencias * 100, width=width, bottom=0, 
-                    color=plt.cm.viridis(np.array(velocidades_medias) / max(velocidades_medias)))
+        bars = ax.bar(layout.theta, frequencias * 100, width=layout.largura_rad, bottom=0, color=cores)
 
         # Personalizar gráficos
         ax.set_theta_zero_location('N')
@@ -200,12 +495,12 @@ class WindAnalyzer:
        
         # Adicionar titulo e legenda
         titulo = titulo or f"Rosa dos Ventos - {estacao if estacao else 'Todas Estações'}"
-        plt.title(titulo, y=1.1)
+        ax.set_title(titulo, y=1.1)
 
         # Adicionar barra de cores para velocidade
-        sm = plt.cm.ScalarMappable(cmap='viridis', norm=plt.Normalize(vmin=min(velocidades_medias), vmax=max(velocidades_medias)))
+        sm = plt.cm.ScalarMappable(cmap='viridis', norm=plt.Normalize(vmin=vmin, vmax=vmax))
         sm._A = []
-        cbar = plt.colorbar(sm, ax=ax, pad=0.1)
+        cbar = fig.colorbar(sm, ax=ax, pad=0.1)
         cbar.set_label("Velocidade (m/s)")
 
         return fig
@@ -228,12 +523,16 @@ class WindAnalyzer:
         estatisticas = self.calcular_estatisticas(estacao)
         self.ajustar_distribuicao_weibull(estacao)
         potencial = self.calcular_potencial_eolico(estacao)
+        # Período da própria estação (o da base inteira se a estação não tiver registros válidos)
+        periodo = self._dados_estacao(estacao)['data']
+        if periodo.empty:
+            periodo = self.dados['data']
 
         # Gerar texto do relatório
         relatorio = f"""
         RELATÓRIO TÉCNICO - ANÁLISE EÓLICA
         Estação: {estacao}
-        Período: {self.dados['data'].min().date()} a {self.dados['data'].max().date()}
+        Período: {periodo.min().date()} a {periodo.max().date()}
         =============================================
         
         1. ESTATÍSTICAS BÁSICAS:
@@ -247,8 +546,9 @@ class WindAnalyzer:
         """
         
         # Adicionar parâmetros de Weibull por setor
-        for setor, params in self.parametros_weibull[estacao].items():
-            relatorio += f"\n   - {setor}: k={params['k']:.2f}, c={params['c']:.2f} m/s, freq={params['frequencia']*100:.1f}%"
+        p = self.parametros_weibull[estacao]
+        for setor, k, c, freq in zip(p['setor'], p['k'], p['c'], p['frequencia']):
+            relatorio += f"\n   - setor_{setor}: k={k:.2f}, c={c:.2f} m/s, freq={freq*100:.1f}%"
         
         relatorio += f"""
         
@@ -272,6 +572,38 @@ class WindAnalyzer:
                 f.write(relatorio)
         
         return relatorio
+
+    def gerar_relatorios_todas(self, pasta_saida: str = None, max_workers: int = None) -> Dict[str, str]:
+        """
+        Gera os relatórios técnicos de todas as estações em paralelo.
+
+        Cada estação é processada em um processo separado, que recebe apenas
+        os dados da própria estação.
+
+        Args:
+            pasta_saida (str): Pasta onde salvar os relatórios como '<estacao>.txt' (None para não salvar)
+            max_workers (int): Número máximo de processos (None para o padrão do sistema)
+
+        Returns:
+            Dict[str, str]: Texto do relatório gerado por estação
+        """
+        def arquivo_saida(estacao: str) -> Optional[str]:
+            return os.path.join(pasta_saida, f'{estacao}.txt') if pasta_saida else None
+
+        relatorios = {}
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futuros = {
+                est: executor.submit(_gerar_relatorio_estacao, self._dados_estacao(est), est, arquivo_saida(est))
+                for est in self.estacoes if est in self._indices_estacao
+            }
+            for est in self.estacoes:
+                if est in futuros:
+                    relatorios[est], self.parametros_weibull[est] = futuros[est].result()
+                else:
+                    # Estação sem registros válidos: não há trabalho a distribuir
+                    relatorios[est] = self.gerar_relatorio(est, arquivo_saida(est))
+
+        return relatorios
     
     def _classificar_potencial(self, potencial: float) -> str:
         """
@@ -309,21 +641,42 @@ class WindAnalyzer:
         # Na prática, você precisaria adaptar para sua estrutura de dados específica
         resultados = {}
 
-        # Calcular perfil de vento e expoente de cisalhamento
-        velocidades_medias = []
-        for altura in alturas:
-            mascara = (self.dados['estacao'] == estacao) & (self.dados['altura'] == altura)
-            velocidades_medias.append(self.dados[mascara]['velocidade'].mean())
+        # Calcular perfil de vento (média por altura em um único groupby)
+        dados = self._dados_estacao(estacao)
+        velocidades_medias = dados.groupby('altura')['velocidade'].mean().reindex(alturas)
         
-        # Ajustar lei de potência (v2/v1 = (h2/h1)^alpha)
+        # Alturas sem registros (média NaN) ficam fora do ajuste
+        validas = velocidades_medias.dropna()
+        if len(validas) < 2:
+            resultados['erro'] = "Não foi possível calcular o cisalhamento - dados insuficientes"
+            return resultados
+
+        # Ajustar lei de potência (v = K * h^alpha) por mínimos quadrados em log-log
         try:
-            alpha = np.log(velocidades_medias[1] / velocidades_medias[0]) / np.log(alturas[1] / alturas[0])
+            alpha, _ = np.polyfit(np.log(validas.index.to_numpy(dtype=np.float64)), np.log(validas.to_numpy()), 1)
             resultados['expoente_cissalhamento'] = alpha
             resultados['perfil_vertical'] = dict(zip(alturas, velocidades_medias))
-        except:
+        except (ValueError, np.linalg.LinAlgError):
             resultados['erro'] = "Não foi possível calcular o cisalhamento - dados insuficientes"
         
         return resultados
+
+def _gerar_relatorio_estacao(dados: pd.DataFrame, estacao: str,
+                             arquivo_saida: Optional[str]) -> Tuple[str, Dict]:
+    """
+    Gera o relatório de uma única estação (executado em um processo separado).
+
+    Args:
+        dados (pd.DataFrame): Dados já pré-processados da estação
+        estacao (str): Nome da estação
+        arquivo_saida (str): Caminho para salvar o relatório (None para não salvar)
+
+    Returns:
+        Tuple[str, Dict]: Texto do relatório e parâmetros de Weibull da estação
+    """
+    analisador = WindAnalyzer(dados)
+    relatorio = analisador.gerar_relatorio(estacao, arquivo_saida)
+    return relatorio, analisador.parametros_weibull[estacao]
         
 if __name__ == '__main__':
     #criar dados de exemplo